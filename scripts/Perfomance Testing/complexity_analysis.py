@@ -0,0 +1,892 @@
+#!/usr/bin/env python3
+"""
+Complexity Analysis for Research Paper
+Analyzes time and space complexity of BEKD operations
+"""
+
+import math
+import time
+import numpy as np
+from py_ecc.secp256k1 import secp256k1
+from eth_utils import keccak
+import secrets
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Tuple
+
+try:
+    # libsecp256k1 bindings; py_ecc is used as a fallback backend
+    from coincurve import PrivateKey, PublicKey
+except ImportError:
+    PrivateKey = PublicKey = None
+
+try:
+    # Call pycryptodome's Keccak-256 directly instead of going through
+    # eth_utils' backend dispatch (hashlib.sha3_256 uses different padding)
+    from Crypto.Hash import keccak as _keccak_impl
+    
+    def _keccak256(data):
+        return _keccak_impl.new(digest_bits=256, data=data).digest()
+except ImportError:
+    _keccak256 = keccak
+
+try:
+    # C-level JSON encoder with native NumPy scalar/array support
+    import orjson
+except ImportError:
+    orjson = None
+
+# Window width for variable-base wNAF scalar multiplication (py_ecc backend)
+WNAF_WIDTH = 4
+
+# Window width of the joint a·P + b·G table for Shamir's trick (py_ecc backend)
+SHAMIR_WIDTH = 2
+
+# Column layout of the per-trial operation-count arrays
+SCALAR_MULT, POINT_ADD, HASH, LAGRANGE = range(4)
+OP_NAMES = ("scalar_mult", "point_add", "hash", "lagrange")
+
+# Constant LaTeX scaffolding shared by every generate_latex_tables call
+_LATEX_TIME_HEADER = (
+    "% Table 1: Time Complexity of Basic Operations",
+    "\\begin{table}[h]",
+    "\\centering",
+    "\\caption{Time Complexity of Cryptographic Operations}",
+    "\\begin{tabular}{lcc}",
+    "\\hline",
+    "Operation & Time (ms) & Complexity \\\\",
+    "\\hline",
+)
+_LATEX_SPACE_HEADER = (
+    "% Table 2: Space Complexity",
+    "\\begin{table}[h]",
+    "\\centering",
+    "\\caption{Storage Requirements}",
+    "\\begin{tabular}{lcc}",
+    "\\hline",
+    "Component & Size (bytes) & Complexity \\\\",
+    "\\hline",
+)
+_LATEX_FOOTER = (
+    "\\hline",
+    "\\end{tabular}",
+    "\\end{table}",
+)
+
+
+def _batch_inverse(values, modulus):
+    """Invert every element of values mod modulus with one inversion (Montgomery's trick)"""
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = (acc * v) % modulus
+        prefix.append(acc)
+    
+    inv = pow(acc, -1, modulus)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = (inv * prefix[i - 1]) % modulus
+        inv = (inv * values[i]) % modulus
+    inverses[0] = inv
+    
+    return inverses
+
+
+def _to_affine_many(points):
+    """Convert Jacobian points to affine (x, y) sharing a single field inversion"""
+    P = secp256k1.P
+    z_invs = _batch_inverse([Z for _, _, Z in points], P)
+    return [
+        ((X * zi * zi) % P, (Y * zi * zi * zi) % P)
+        for (X, Y, _), zi in zip(points, z_invs)
+    ]
+
+
+def _wnaf(k, w=WNAF_WIDTH):
+    """Width-w non-adjacent form of k, least significant digit first"""
+    digits = []
+    while k:
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+def _average_ops(ops):
+    """Per-operation means of a (num_trials, k) operation-count array"""
+    return dict(zip(OP_NAMES, ops.mean(axis=0).tolist()))
+
+
+def _write_svg_panels(path, xs, panels, width=320, height=260, pad=48):
+    """Write side-by-side line charts [(title, ylabel, ys, color), ...] as a standalone SVG"""
+    x_lo, x_hi = min(xs), max(xs)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width * len(panels)}" '
+        f'height="{height}" font-family="sans-serif" font-size="11">'
+    ]
+    for i, (title, ylabel, ys, color) in enumerate(panels):
+        left, right = i * width + pad, (i + 1) * width - pad // 3
+        top, bottom = pad // 2 + 8, height - pad
+        y_hi = max(ys) or 1
+        sx = (right - left) / ((x_hi - x_lo) or 1)
+        sy = (bottom - top) / y_hi
+        points = " ".join(
+            f"{left + (x - x_lo) * sx:.1f},{bottom - y * sy:.1f}" for x, y in zip(xs, ys)
+        )
+        mid_x, mid_y = (left + right) / 2, (top + bottom) / 2
+        parts.append(
+            f'<rect x="{left}" y="{top}" width="{right - left}" height="{bottom - top}" '
+            f'fill="none" stroke="#999"/>'
+            f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="2"/>'
+            f'<text x="{mid_x}" y="{top - 8}" text-anchor="middle" font-size="13">{title}</text>'
+            f'<text x="{left}" y="{bottom + 14}" text-anchor="middle">{x_lo}</text>'
+            f'<text x="{right}" y="{bottom + 14}" text-anchor="middle">{x_hi}</text>'
+            f'<text x="{mid_x}" y="{height - 8}" text-anchor="middle">Number of Features (n)</text>'
+            f'<text x="{left - 4}" y="{top + 4}" text-anchor="end">{y_hi:.3g}</text>'
+            f'<text x="{left - 4}" y="{bottom}" text-anchor="end">0</text>'
+            f'<text x="{left - 30}" y="{mid_y}" text-anchor="middle" '
+            f'transform="rotate(-90 {left - 30} {mid_y})">{ylabel}</text>'
+        )
+    parts.append("</svg>\n")
+    
+    with open(path, 'w') as f:
+        f.write("\n".join(parts))
+
+
+def _stats(xs):
+    """Mean, std, min and max of times in seconds, as milliseconds"""
+    n = len(xs)
+    mean = math.fsum(xs) / n
+    var = math.fsum((x - mean) ** 2 for x in xs) / n
+    return mean * 1000, math.sqrt(var) * 1000, min(xs) * 1000, max(xs) * 1000
+
+
+def _time_batch(fn, args, batch):
+    """Mean seconds per call of fn(*args) over batch back-to-back calls"""
+    start = time.perf_counter_ns()
+    for _ in range(batch):
+        fn(*args)
+    return (time.perf_counter_ns() - start) / batch / 1e9
+
+
+class ComplexityAnalyzer:
+    """Analyzes computational complexity of BEKD operations"""
+    
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = "coincurve" if PublicKey is not None else "py_ecc"
+        if backend not in ("coincurve", "py_ecc"):
+            raise ValueError(f"Unknown EC backend: {backend}")
+        if backend == "coincurve" and PublicKey is None:
+            raise ImportError("coincurve backend requested but coincurve is not installed")
+        
+        self.backend = backend
+        self.N = secp256k1.N
+        if backend == "coincurve":
+            self.G = PublicKey.from_point(*secp256k1.G)
+        else:
+            self.G = secp256k1.G
+            self._G_pow2 = self._precompute_g_pow2()
+        self.results = {
+            "backend": backend,
+            "time_complexity": {},
+            "space_complexity": {},
+            "operation_counts": {}
+        }
+        # Barycentric weights keyed by (x-coordinates, modulus)
+        self._bary_weights = {}
+        # Lagrange coefficients lambda_i(0) keyed by x-coordinates
+        self._lagrange = {}
+    
+    def _barycentric_weights(self, xs):
+        """Weights w_i = 1 / prod_{j != i}(x_i - x_j) mod N, computed once per x-set"""
+        key = (tuple(xs), self.N)
+        weights = self._bary_weights.get(key)
+        if weights is None:
+            denominators = []
+            for i, xi in enumerate(xs):
+                denominator = 1
+                for j, xj in enumerate(xs):
+                    if i != j:
+                        denominator = (denominator * (xi - xj)) % self.N
+                denominators.append(denominator)
+            weights = _batch_inverse(denominators, self.N)
+            self._bary_weights[key] = weights
+        return weights
+    
+    def _lagrange_coefficients(self, xs):
+        """lambda_i(0) = l(0) · w_i / (0 - x_i) mod N, computed once per x-set"""
+        key = tuple(xs)
+        lambdas = self._lagrange.get(key)
+        if lambdas is None:
+            weights = self._barycentric_weights(xs)
+            diffs = [(0 - xi) % self.N for xi in xs]
+            l0 = 1
+            for d in diffs:
+                l0 = (l0 * d) % self.N
+            lambdas = [
+                (l0 * w * d_inv) % self.N
+                for w, d_inv in zip(weights, _batch_inverse(diffs, self.N))
+            ]
+            self._lagrange[key] = lambdas
+        return lambdas
+    
+    # ==================== EC Backend ====================
+    
+    def _precompute_g_pow2(self):
+        """Fixed-base table [2^i · G for i in 0..255], normalized to Z = 1"""
+        table = [secp256k1.to_jacobian(self.G)]
+        for _ in range(255):
+            table.append(secp256k1.jacobian_double(table[-1]))
+        
+        return [(x, y, 1) for x, y in _to_affine_many(table)]
+    
+    def _mul_g(self, k):
+        """Compute g^k with the selected backend"""
+        if self.backend == "coincurve":
+            return PrivateKey.from_int(k).public_key
+        return _to_affine_many([self._jacobian_mul_g(k)])[0]
+    
+    def _mul(self, point, k):
+        """Compute point^k with the selected backend"""
+        if self.backend == "coincurve":
+            return point.multiply(k.to_bytes(32, 'big'))
+        return _to_affine_many([self._jacobian_mul(point, k)])[0]
+    
+    def _mul_many(self, point, scalars):
+        """Compute [point^k for k in scalars]; py_ecc shares one field inversion"""
+        if self.backend == "coincurve":
+            return [point.multiply(k.to_bytes(32, 'big')) for k in scalars]
+        return _to_affine_many([self._jacobian_mul(point, k) for k in scalars])
+    
+    def _mul2_many(self, point, scalars, g_scalars):
+        """Compute [point^a · g^b for a, b in zip(scalars, g_scalars)]"""
+        if self.backend == "coincurve":
+            return [
+                PublicKey.combine_keys([
+                    point.multiply(a.to_bytes(32, 'big')),
+                    PrivateKey.from_int(b).public_key,
+                ])
+                for a, b in zip(scalars, g_scalars)
+            ]
+        
+        # Shamir's trick: the joint table depends only on (point, G), so it is
+        # built once and shared by every (a, b) pair
+        table = self._shamir_table(point)
+        return _to_affine_many([
+            self._jacobian_mul2(table, a, b) for a, b in zip(scalars, g_scalars)
+        ])
+    
+    def _add_many(self, points, others):
+        """Compute [p · q for p, q in zip(points, others)]; py_ecc shares one field inversion"""
+        if self.backend == "coincurve":
+            return [PublicKey.combine_keys([p, q]) for p, q in zip(points, others)]
+        return _to_affine_many([
+            secp256k1.jacobian_add(secp256k1.to_jacobian(p), secp256k1.to_jacobian(q))
+            for p, q in zip(points, others)
+        ])
+    
+    def _multi_exp(self, points, scalars):
+        """Compute prod(p^k for p, k in zip(points, scalars)) as a single point"""
+        if self.backend == "coincurve":
+            return PublicKey.combine_keys([
+                p.multiply(k.to_bytes(32, 'big')) for p, k in zip(points, scalars)
+            ])
+        acc = (0, 0, 1)
+        for p, k in zip(points, scalars):
+            acc = secp256k1.jacobian_add(acc, self._jacobian_mul(p, k))
+        return _to_affine_many([acc])[0]
+    
+    def _shamir_table(self, point):
+        """Joint table T[(i << w) | j] = i·point + j·G for 0 <= i, j < 2^w"""
+        size = 1 << SHAMIR_WIDTH
+        p_multiples = [(0, 0, 1), secp256k1.to_jacobian(point)]
+        g_multiples = [(0, 0, 1), secp256k1.to_jacobian(self.G)]
+        for _ in range(size - 2):
+            p_multiples.append(secp256k1.jacobian_add(p_multiples[-1], p_multiples[1]))
+            g_multiples.append(secp256k1.jacobian_add(g_multiples[-1], g_multiples[1]))
+        return [secp256k1.jacobian_add(pm, gm) for pm in p_multiples for gm in g_multiples]
+    
+    def _jacobian_mul2(self, table, a, b):
+        """a·point + b·G in Jacobian coordinates, sharing one doubling chain"""
+        mask = (1 << SHAMIR_WIDTH) - 1
+        top = max(a.bit_length(), b.bit_length())
+        top += -top % SHAMIR_WIDTH
+        
+        acc = (0, 0, 1)
+        for shift in range(top - SHAMIR_WIDTH, -1, -SHAMIR_WIDTH):
+            for _ in range(SHAMIR_WIDTH):
+                acc = secp256k1.jacobian_double(acc)
+            d = (((a >> shift) & mask) << SHAMIR_WIDTH) | ((b >> shift) & mask)
+            if d:
+                acc = secp256k1.jacobian_add(acc, table[d])
+        return acc
+    
+    def _jacobian_mul_g(self, k):
+        """g^k in Jacobian coordinates (py_ecc backend)"""
+        # Binary scan over the precomputed powers of two: no doublings
+        acc = (0, 0, 1)
+        i = 0
+        while k:
+            if k & 1:
+                acc = secp256k1.jacobian_add(acc, self._G_pow2[i])
+            k >>= 1
+            i += 1
+        return acc
+    
+    def _jacobian_mul(self, point, k):
+        """point^k in Jacobian coordinates (py_ecc backend)"""
+        # wNAF: odd multiples {1, 3, ..., 2^(w-1) - 1}·P, negated on demand
+        P = secp256k1.P
+        base = secp256k1.to_jacobian(point)
+        double = secp256k1.jacobian_double(base)
+        odd = [base]
+        for _ in range((1 << (WNAF_WIDTH - 2)) - 1):
+            odd.append(secp256k1.jacobian_add(odd[-1], double))
+        
+        acc = (0, 0, 1)
+        for d in reversed(_wnaf(k)):
+            acc = secp256k1.jacobian_double(acc)
+            if d > 0:
+                acc = secp256k1.jacobian_add(acc, odd[d >> 1])
+            elif d < 0:
+                X, Y, Z = odd[-d >> 1]
+                acc = secp256k1.jacobian_add(acc, (X, (-Y) % P, Z))
+        return acc
+    
+    # ==================== Primitives ====================
+    
+    def _hash_to_scalar(self, Wi, salt):
+        """wi = H0(Wi, salt) reduced mod N"""
+        # Plain concatenation on purpose: writing Wi and salt into a reused
+        # bytearray is slower here (slice assignment plus the hash's
+        # non-bytes input path cost more than one 66-byte allocation).
+        # Likewise '% N' beats a compare-and-subtract: 2^256 < 2N, so CPython's
+        # long division finishes in a single quotient digit step.
+        return int.from_bytes(_keccak256(b"H0" + Wi + salt), 'big') % self.N
+    
+    def _share(self, coefficients, n):
+        """Evaluate the polynomial at x = 1..n, returning (xs, ys)"""
+        # Evaluate polynomial at all n points at once (Horner's rule)
+        xs = list(range(1, n + 1))
+        values = [0] * n
+        for coeff in reversed(coefficients):
+            values = [(v * x + coeff) % self.N for v, x in zip(values, xs)]
+        return xs, values
+    
+    def _interpolate_at_zero(self, xs, ys):
+        """Recover f(0) from shares (xs, ys) by Lagrange interpolation"""
+        # lambda_i(0) depends only on the x-set, so each call is one dot product
+        lambdas = self._lagrange_coefficients(xs)
+        return sum(y * lam for y, lam in zip(ys, lambdas)) % self.N
+    
+    # ==================== Time Complexity ====================
+    
+    def measure_scalar_multiplication(self, num_trials=100, batch=10):
+        """Measure g^k operation (core of BEKD)"""
+        times = []
+        # Random inputs are drawn up front so only g^k is timed
+        scalars = [secrets.randbelow(self.N - 1) + 1 for _ in range(num_trials)]
+        
+        for k in scalars:
+            times.append(_time_batch(self._mul_g, (k,), batch))
+        
+        mean_ms, std_ms, min_ms, max_ms = _stats(times)
+        self.results["time_complexity"]["scalar_multiplication"] = {
+            "mean_ms": mean_ms,
+            "std_ms": std_ms,
+            "min_ms": min_ms,
+            "max_ms": max_ms,
+            "batch": batch,
+            "complexity": "O(log n)",  # Double-and-add algorithm
+            "description": f"Computing K = g^k on secp256k1 ({self.backend})"
+        }
+        
+        return mean_ms
+    
+    def measure_hash_to_scalar(self, num_trials=100, batch=1000):
+        """Measure H0(Wi, salt) operation"""
+        times = []
+        inputs = [(secrets.token_bytes(32), secrets.token_bytes(32)) for _ in range(num_trials)]
+        
+        for Wi, salt in inputs:
+            times.append(_time_batch(self._hash_to_scalar, (Wi, salt), batch))
+        
+        mean_ms, std_ms, _, _ = _stats(times)
+        self.results["time_complexity"]["hash_to_scalar"] = {
+            "mean_ms": mean_ms,
+            "std_ms": std_ms,
+            "batch": batch,
+            "complexity": "O(1)",
+            "description": "Computing wi = H0(Wi, salt)"
+        }
+        
+        return mean_ms
+    
+    def measure_shamir_sharing(self, t=1, n=3, num_trials=50, batch=1000):
+        """Measure Shamir secret sharing construction"""
+        times = []
+        # Generate polynomials
+        polynomials = [
+            [secrets.randbelow(self.N - 1) + 1 for _ in range(t)]
+            for _ in range(num_trials)
+        ]
+        
+        for coefficients in polynomials:
+            times.append(_time_batch(self._share, (coefficients, n), batch))
+        
+        mean_ms, std_ms, _, _ = _stats(times)
+        self.results["time_complexity"]["shamir_sharing"] = {
+            "mean_ms": mean_ms,
+            "std_ms": std_ms,
+            "batch": batch,
+            "complexity": f"O(t × n) = O({t} × {n})",
+            "description": f"Creating {n} shares with threshold {t}"
+        }
+        
+        return mean_ms
+    
+    def measure_lagrange_interpolation(self, t=1, num_trials=50, batch=1000):
+        """Measure Lagrange interpolation for secret reconstruction"""
+        times = []
+        # Create dummy shares
+        xs = list(range(1, t + 2))
+        share_sets = [
+            [secrets.randbelow(self.N - 1) + 1 for _ in range(t + 1)]
+            for _ in range(num_trials)
+        ]
+        
+        for ys in share_sets:
+            times.append(_time_batch(self._interpolate_at_zero, (xs, ys), batch))
+        
+        mean_ms, std_ms, _, _ = _stats(times)
+        self.results["time_complexity"]["lagrange_interpolation"] = {
+            "mean_ms": mean_ms,
+            "std_ms": std_ms,
+            "batch": batch,
+            "complexity": f"O(t+1) = O({t+1})",
+            "description": f"Reconstructing secret from {t+1} shares with precomputed λ_i(0)"
+        }
+        
+        # One-off cost of deriving lambda_i(0) for the x-set, reported
+        # separately; the caches are cleared so every call starts from scratch
+        def derive_coefficients():
+            self._bary_weights.clear()
+            self._lagrange.clear()
+            self._lagrange_coefficients(xs)
+        
+        setup_times = [_time_batch(derive_coefficients, (), batch) for _ in range(num_trials)]
+        setup_ms, setup_std_ms, _, _ = _stats(setup_times)
+        self.results["time_complexity"]["lagrange_coefficients"] = {
+            "mean_ms": setup_ms,
+            "std_ms": setup_std_ms,
+            "batch": batch,
+            "complexity": f"O((t+1)²) = O({(t+1)**2})",
+            "description": f"Deriving λ_i(0) once for a set of {t+1} x-coordinates"
+        }
+        
+        return mean_ms
+    
+    def measure_enrollment_phase(self, n=3, num_trials=20, t=1):
+        """Measure complete enrollment phase"""
+        times = []
+        ops = np.zeros((num_trials, len(OP_NAMES)), dtype=np.int64)
+        # Per trial: polynomial f with f(0) = k, r and one (Wi, salt) pair per feature
+        trials = [
+            (
+                [secrets.randbelow(self.N - 1) + 1 for _ in range(t + 1)],
+                secrets.randbelow(self.N - 1) + 1,
+                [(secrets.token_bytes(32), secrets.token_bytes(32)) for _ in range(n)],
+            )
+            for _ in range(num_trials)
+        ]
+        
+        for trial, (coefficients, r, features) in enumerate(trials):
+            start = time.perf_counter_ns()
+            
+            # K = g^k
+            self._mul_g(coefficients[0])
+            ops[trial, SCALAR_MULT] += 1
+            
+            # R0 = g^r
+            R0 = self._mul_g(r)
+            ops[trial, SCALAR_MULT] += 1
+            
+            # For each feature: hash to scalar
+            ws = []
+            for Wi, salt in features:
+                ws.append(self._hash_to_scalar(Wi, salt))
+                ops[trial, HASH] += 1
+            
+            # Compute masked shares: Ai = R0^wi * g^f(i), one joint
+            # double-scalar multiplication per feature
+            fs = self._share(coefficients, n)[1]
+            self._mul2_many(R0, ws, fs)
+            ops[trial, SCALAR_MULT] += n
+            ops[trial, POINT_ADD] += n
+            
+            times.append((time.perf_counter_ns() - start) / 1e9)
+        
+        avg_ops = _average_ops(ops)
+        
+        mean_ms, std_ms, _, _ = _stats(times)
+        self.results["time_complexity"]["enrollment_phase"] = {
+            "mean_ms": mean_ms,
+            "std_ms": std_ms,
+            "operations": avg_ops,
+            "complexity": f"O(n) = O({n})",
+            "description": f"Complete enrollment with {n} biometric features"
+        }
+        
+        self.results["operation_counts"]["enrollment"] = avg_ops
+        
+        return mean_ms
+    
+    def measure_authentication_phase(self, n=3, t=1, num_trials=20):
+        """Measure complete authentication phase"""
+        if n < t + 1:
+            raise ValueError(f"Recovering K needs at least t+1 = {t + 1} shares, got n={n}")
+        
+        times = []
+        ops = np.zeros((num_trials, len(OP_NAMES)), dtype=np.int64)
+        # Per trial, enrolled outside the timed region: R0 = g^r, the masked
+        # shares Ai = R0^wi · g^f(i), skCA, the (W'i, salt) pairs of a
+        # genuine user (W'i = Wi) and the K = g^k authentication must recover
+        trials = []
+        for _ in range(num_trials):
+            coefficients = [secrets.randbelow(self.N - 1) + 1 for _ in range(t + 1)]
+            R0 = self._mul_g(secrets.randbelow(self.N - 1) + 1)
+            features = [(secrets.token_bytes(32), secrets.token_bytes(32)) for _ in range(n)]
+            ws = [self._hash_to_scalar(Wi, salt) for Wi, salt in features]
+            fs = self._share(coefficients, n)[1]
+            sk_ca = secrets.randbelow(self.N - 1) + 1
+            K = self._mul_g(coefficients[0])
+            trials.append((R0, self._mul2_many(R0, ws, fs), sk_ca, features, K))
+        
+        # lambda_i(0) for the x-set 1..t+1 is fixed, so it is derived once here
+        lambdas = self._lagrange_coefficients(list(range(1, t + 2)))
+        
+        for trial, (R0, A, sk_ca, features, K) in enumerate(trials):
+            start = time.perf_counter_ns()
+            
+            # Client-side: Compute w'i for each feature
+            ws_prime = []
+            for Wi_prime, salt in features:
+                ws_prime.append(self._hash_to_scalar(Wi_prime, salt))
+                ops[trial, HASH] += 1
+            
+            # Recover shares: g^f(i) = Ai / R0^w'i = Ai · R0^(N - w'i), with all
+            # n R0^-w'i computed in one batch
+            masks = self._mul_many(R0, [self.N - w for w in ws_prime])
+            recovered = self._add_many(A, masks)
+            ops[trial, SCALAR_MULT] += n
+            ops[trial, POINT_ADD] += n
+            
+            # Lagrange interpolation in the exponent over the first t+1
+            # shares: K = prod(g^f(i)^lambda_i(0))
+            K_recovered = self._multi_exp(recovered[:t + 1], lambdas)
+            ops[trial, SCALAR_MULT] += t + 1
+            ops[trial, POINT_ADD] += t
+            ops[trial, LAGRANGE] = t + 1
+            
+            # CA-side: Compute helper = R0^skCA
+            self._mul(R0, sk_ca)
+            ops[trial, SCALAR_MULT] += 1
+            
+            times.append((time.perf_counter_ns() - start) / 1e9)
+            
+            if K_recovered != K:
+                raise RuntimeError("Authentication recovered the wrong K")
+        
+        avg_ops = _average_ops(ops)
+        
+        mean_ms, std_ms, _, _ = _stats(times)
+        self.results["time_complexity"]["authentication_phase"] = {
+            "mean_ms": mean_ms,
+            "std_ms": std_ms,
+            "operations": avg_ops,
+            "complexity": f"O(n + t+1) = O({n} + {t+1})",
+            "description": f"Complete authentication with {n} features, threshold {t}"
+        }
+        
+        self.results["operation_counts"]["authentication"] = avg_ops
+        
+        return mean_ms
+    
+    # ==================== Space Complexity ====================
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _space(n):
+        """Storage layout for n features (pure function of n, cached)"""
+        
+        # Token storage (off-chain)
+        token_size = {
+            "salt": 32,  # bytes
+            "R0": 64,    # uncompressed EC point
+            "R1": 64,    # uncompressed EC point
+            "sigma": 65,  # ECDSA signature
+            "Ai": 64 * n  # n masked shares
+        }
+        
+        total_token_bytes = sum(token_size.values())
+        
+        # On-chain storage
+        onchain_size = {
+            "token_id_rho": 32,  # bytes32 in SpentSet mapping
+            "used_flag": 1,      # bool (1 byte)
+            "ca_public_key": 64,  # stored in ParamRegistry
+            "owner_address": 20   # address in BiometricWallet
+        }
+        
+        total_onchain_bytes = sum(onchain_size.values())
+        
+        return token_size, total_token_bytes, onchain_size, total_onchain_bytes
+    
+    def analyze_space_complexity(self, n=3, t=1):
+        """Analyze storage requirements"""
+        token_size, total_token_bytes, onchain_size, total_onchain_bytes = self._space(n)
+        
+        self.results["space_complexity"] = {
+            "offchain_token_bytes": total_token_bytes,
+            "offchain_token_kb": total_token_bytes / 1024,
+            "offchain_breakdown": dict(token_size),
+            "onchain_storage_bytes": total_onchain_bytes,
+            "onchain_storage_kb": total_onchain_bytes / 1024,
+            "onchain_breakdown": dict(onchain_size),
+            "tokens_per_mb_offchain": 1024 * 1024 / total_token_bytes,
+            "complexity": f"O(n) = O({n}) off-chain, O(1) on-chain"
+        }
+        
+        return total_token_bytes, total_onchain_bytes
+    
+    # ==================== Scalability Analysis ====================
+    
+    def analyze_scalability(self, n_values=[1, 3, 5, 10, 20, 50, 100], max_workers=1, plot=False):
+        """Analyze how performance scales with number of features"""
+        enrollment_times = []
+        authentication_times = []
+        storage_sizes = []
+        
+        # Quick measurement with a fresh analyzer per n value, so the n=3 phase
+        # results reported above stay intact. Sequential by default: parallel
+        # workers contend for cores and skew the timings, so max_workers > 1
+        # is only meant for quick runs.
+        args = (_run_scalability_point, repeat(self.backend), n_values, repeat(10))
+        if max_workers == 1:
+            timings = list(map(*args))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                timings = list(ex.map(*args))
+        
+        for n, (enroll_time, auth_time) in zip(n_values, timings):
+            # Sizes only; leaves the reported space_complexity untouched
+            _, token_size, _, _ = self._space(n)
+            
+            enrollment_times.append(enroll_time)
+            authentication_times.append(auth_time)
+            storage_sizes.append(token_size / 1024)
+        
+        self.results["scalability"] = {
+            "n_values": n_values,
+            "enrollment_times_ms": enrollment_times,
+            "authentication_times_ms": authentication_times,
+            "storage_sizes_kb": storage_sizes
+        }
+        
+        # Raw data and a lightweight SVG; the matplotlib figure is opt-in
+        self._save_scalability(n_values, enrollment_times, authentication_times, storage_sizes)
+        if plot:
+            self._plot_scalability(n_values, enrollment_times, authentication_times, storage_sizes)
+        
+        return n_values, enrollment_times, authentication_times
+    
+    def _save_scalability(self, n_values, enroll_times, auth_times, storage):
+        """Write scalability data as CSV plus a minimal SVG chart"""
+        with open('/mnt/user-data/outputs/scalability_analysis.csv', 'w') as f:
+            f.write("n,enroll_ms,auth_ms,kb\n")
+            f.writelines(
+                f"{n},{e!r},{a!r},{kb!r}\n"
+                for n, e, a, kb in zip(n_values, enroll_times, auth_times, storage)
+            )
+        
+        _write_svg_panels('/mnt/user-data/outputs/scalability_analysis.svg', n_values, [
+            ("Enrollment Scalability", "Enrollment Time (ms)", enroll_times, "#1f77b4"),
+            ("Authentication Scalability", "Authentication Time (ms)", auth_times, "#ff7f0e"),
+            ("Storage Requirements", "Token Size (KB)", storage, "#2ca02c"),
+        ])
+        print("✅ Scalability data saved: scalability_analysis.csv, scalability_analysis.svg")
+    
+    def _plot_scalability(self, n_values, enroll_times, auth_times, storage):
+        """Generate scalability plots for paper (requires matplotlib)"""
+        # Imported here so runs that only want the numbers never load matplotlib
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        # Figure on an Agg canvas, outside pyplot's global figure registry
+        fig = Figure(figsize=(15, 4))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(1, 3)
+        
+        # Plot 1: Enrollment time vs n
+        axes[0].plot(n_values, enroll_times, 'o-', linewidth=2, markersize=8)
+        axes[0].set_xlabel('Number of Features (n)', fontsize=12)
+        axes[0].set_ylabel('Enrollment Time (ms)', fontsize=12)
+        axes[0].set_title('Enrollment Scalability', fontsize=14)
+        axes[0].grid(True, alpha=0.3)
+        
+        # Plot 2: Authentication time vs n
+        axes[1].plot(n_values, auth_times, 's-', linewidth=2, markersize=8, color='orange')
+        axes[1].set_xlabel('Number of Features (n)', fontsize=12)
+        axes[1].set_ylabel('Authentication Time (ms)', fontsize=12)
+        axes[1].set_title('Authentication Scalability', fontsize=14)
+        axes[1].grid(True, alpha=0.3)
+        
+        # Plot 3: Storage size vs n
+        axes[2].plot(n_values, storage, '^-', linewidth=2, markersize=8, color='green')
+        axes[2].set_xlabel('Number of Features (n)', fontsize=12)
+        axes[2].set_ylabel('Token Size (KB)', fontsize=12)
+        axes[2].set_title('Storage Requirements', fontsize=14)
+        axes[2].grid(True, alpha=0.3)
+        
+        fig.tight_layout()
+        fig.savefig('/mnt/user-data/outputs/scalability_analysis.png', dpi=300, bbox_inches='tight')
+        print("✅ Scalability plot saved: scalability_analysis.png")
+    
+    # ==================== Report Generation ====================
+    
+    def run_full_analysis(self, plot=False):
+        """Run complete complexity analysis"""
+        print("=" * 70)
+        print("COMPLEXITY ANALYSIS FOR RESEARCH PAPER")
+        print("=" * 70)
+        print()
+        
+        print("📊 1. Time Complexity - Basic Operations")
+        print("-" * 70)
+        scalar_mult_time = self.measure_scalar_multiplication()
+        print(f"Scalar Multiplication (g^k): {scalar_mult_time:.4f} ms (O(log n))")
+        
+        hash_time = self.measure_hash_to_scalar()
+        print(f"Hash to Scalar (H0): {hash_time:.4f} ms (O(1))")
+        
+        shamir_time = self.measure_shamir_sharing()
+        print(f"Shamir Sharing (t=1, n=3): {shamir_time:.4f} ms (O(t×n))")
+        
+        lagrange_time = self.measure_lagrange_interpolation()
+        print(f"Lagrange Interpolation (t=1): {lagrange_time:.4f} ms (O(t+1), precomputed λ_i(0))")
+        coefficients_time = self.results["time_complexity"]["lagrange_coefficients"]["mean_ms"]
+        print(f"Lagrange Coefficients (t=1, once per x-set): {coefficients_time:.4f} ms (O((t+1)²))")
+        print()
+        
+        print("📊 2. Time Complexity - Protocol Phases")
+        print("-" * 70)
+        enroll_time = self.measure_enrollment_phase()
+        print(f"Enrollment Phase (n=3): {enroll_time:.4f} ms (O(n))")
+        
+        auth_time = self.measure_authentication_phase()
+        print(f"Authentication Phase (n=3, t=1): {auth_time:.4f} ms (O(n + t+1))")
+        print()
+        
+        print("📊 3. Space Complexity")
+        print("-" * 70)
+        offchain_size, onchain_size = self.analyze_space_complexity()
+        print(f"Off-chain Token Size: {offchain_size} bytes ({offchain_size/1024:.2f} KB)")
+        print(f"On-chain Storage: {onchain_size} bytes (O(1) per user)")
+        print()
+        
+        print("📊 4. Scalability Analysis")
+        print("-" * 70)
+        self.analyze_scalability(plot=plot)
+        print("Scalability analysis complete (see CSV/SVG)")
+        print()
+        
+        # Save results
+        self.save_results()
+        
+        return self.results
+    
+    def save_results(self):
+        """Save analysis results to JSON"""
+        path = '/mnt/user-data/outputs/complexity_analysis.json'
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(self.results, f, indent=2)
+        
+        print("✅ Results saved to: complexity_analysis.json")
+    
+    def generate_latex_tables(self):
+        """Generate LaTeX tables for research paper"""
+        # Table 1: Time Complexity
+        latex = list(_LATEX_TIME_HEADER)
+        
+        for op, data in self.results["time_complexity"].items():
+            op_name = op.replace("_", " ").title()
+            time_ms = data["mean_ms"]
+            complexity = data["complexity"]
+            latex.append(f"{op_name} & {time_ms:.3f} & {complexity} \\\\")
+        
+        latex.extend(_LATEX_FOOTER)
+        latex.append("")
+        
+        # Table 2: Space Complexity
+        latex.extend(_LATEX_SPACE_HEADER)
+        
+        sc = self.results["space_complexity"]
+        latex.append(f"Off-chain Token & {sc['offchain_token_bytes']} & O(n) \\\\")
+        latex.append(f"On-chain Storage & {sc['onchain_storage_bytes']} & O(1) \\\\")
+        latex.extend(_LATEX_FOOTER)
+        
+        latex_str = "\n".join(latex)
+        
+        with open('/mnt/user-data/outputs/complexity_tables.tex', 'w') as f:
+            f.write(latex_str)
+        
+        print("✅ LaTeX tables saved to: complexity_tables.tex")
+        return latex_str
+
+
+def _run_scalability_point(backend, n, num_trials):
+    """Enrollment/authentication times (ms) for n features on a fresh analyzer"""
+    analyzer = ComplexityAnalyzer(backend)
+    # Threshold t = 1 where possible; a single feature can only use t = 0
+    t = min(1, n - 1)
+    enroll_time = analyzer.measure_enrollment_phase(n=n, num_trials=num_trials, t=t)
+    auth_time = analyzer.measure_authentication_phase(n=n, t=t, num_trials=num_trials)
+    return enroll_time, auth_time
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plot", action="store_true",
+                        help="also render scalability_analysis.png with matplotlib")
+    args = parser.parse_args()
+    
+    # Run analysis
+    analyzer = ComplexityAnalyzer()
+    results = analyzer.run_full_analysis(plot=args.plot)
+    analyzer.generate_latex_tables()
+    
+    print("\n" + "=" * 70)
+    print("✅ COMPLEXITY ANALYSIS COMPLETE")
+    print("=" * 70)
+    print("\nGenerated files:")
+    print("  - complexity_analysis.json      (Raw data)")
+    print("  - scalability_analysis.csv      (Scalability data)")
+    print("  - scalability_analysis.svg      (Scalability chart)")
+    if args.plot:
+        print("  - scalability_analysis.png      (Figure for paper)")
+    print("  - complexity_tables.tex         (LaTeX tables)")
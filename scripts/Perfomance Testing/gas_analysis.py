@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Gas Consumption Analysis and Visualization
+Generates tables and figures for research paper Section VII
+"""
+
+import importlib.util
+import json
+import numpy as np
+from types import MappingProxyType
+from typing import Dict, List
+
+try:
+    # C-level JSON parser; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _new_figure(**kwargs):
+    """Create a Figure on an Agg canvas, outside pyplot's global figure registry"""
+    # Imported here so the table and LaTeX paths never load matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+# Constant LaTeX scaffolding shared by every generate_latex_tables call
+_LATEX_DEPLOYMENT_HEADER = (
+    "% Table: Deployment Gas Costs",
+    "\\begin{table}[h]",
+    "\\centering",
+    "\\caption{Smart Contract Deployment Gas Costs}",
+    "\\label{tab:deployment_costs}",
+    "\\begin{tabular}{lrrr}",
+    "\\toprule",
+    "Contract & Gas Used & ETH (30 gwei) & USD (\\$3000/ETH) \\\\",
+    "\\midrule",
+)
+_LATEX_OPERATION_HEADER = (
+    "% Table: Operation Gas Costs",
+    "\\begin{table}[h]",
+    "\\centering",
+    "\\caption{Gas Costs for Contract Operations}",
+    "\\label{tab:operation_costs}",
+    "\\begin{tabular}{lrr}",
+    "\\toprule",
+    "Operation & Gas Used & Category \\\\",
+    "\\midrule",
+)
+_LATEX_FOOTER = (
+    "\\bottomrule",
+    "\\end{tabular}",
+    "\\end{table}",
+)
+
+
+class GasAnalyzer:
+    """Analyzes gas consumption data from Hardhat tests"""
+    
+    def __init__(self, gas_profile_path='test-results/gas-profile.json'):
+        """Load gas profiling data"""
+        try:
+            if orjson is not None:
+                with open(gas_profile_path, 'rb') as f:
+                    self.data = orjson.loads(f.read())
+            else:
+                with open(gas_profile_path, 'r') as f:
+                    self.data = json.load(f)
+        except FileNotFoundError:
+            print(f"⚠️  Gas profile not found at {gas_profile_path}")
+            print("Run Hardhat tests first: npx hardhat test")
+            self.data = self._generate_sample_data()
+    
+    @property
+    def data(self):
+        """Loaded gas profile; assigning a new one drops the cached cost tables"""
+        return self._data
+    
+    @data.setter
+    def data(self, data):
+        self._data = data
+        # Cost tables keyed by (gas_price_gwei, eth_price_usd), valid for this data only
+        self._costs = {}
+    
+    def _generate_sample_data(self):
+        """Generate sample data for testing (replace with actual measurements)"""
+        return {
+            "deployment": {
+                "paramRegistry": 180542,
+                "spentSet": 195230,
+                "biometricWallet": 428634,
+                "authorization": 48123,
+                "total": 852529
+            },
+            "operations": {
+                "getPublicKey_cold": 2487,
+                "getPublicKey_warm": 1045,
+                "getThresholdConfig": 892,
+                "isUsed_fresh": 23456,
+                "isAuthorized": 1234,
+                "markUsed_first": 46789,
+                "markUsed_subsequent": 29123,
+                "addAuthorizedKey": 52341,
+                "isValidSignature": 5234,
+                "ecrecover_baseline": 3000,
+                "fullAuthentication": 87654,
+                "individual_checks": 234560,
+                "individual_checks_avg": 23456,
+                "batch_checks": 156789,
+                "batch_checks_avg": 15678
+            }
+        }
+    
+    def calculate_costs(self, gas_price_gwei=30, eth_price_usd=3000):
+        """Calculate actual costs in ETH and USD (cached per price, returned read-only)"""
+        key = (gas_price_gwei, eth_price_usd)
+        if key in self._costs:
+            return self._costs[key]
+        
+        costs = {}
+        
+        for category, operations in self.data.items():
+            category_costs = {}
+            for op, gas in operations.items():
+                eth_cost = gas * gas_price_gwei * 1e-9
+                usd_cost = eth_cost * eth_price_usd
+                category_costs[op] = MappingProxyType({
+                    "gas": gas,
+                    "eth": eth_cost,
+                    "usd": usd_cost
+                })
+            costs[category] = MappingProxyType(category_costs)
+        
+        costs = self._costs[key] = MappingProxyType(costs)
+        return costs
+    
+    def generate_deployment_table(self):
+        """Generate Table 1: Deployment Costs"""
+        print("\n" + "=" * 80)
+        print("TABLE 1: DEPLOYMENT GAS COSTS")
+        print("=" * 80)
+        print(f"{'Contract':<25} {'Gas Used':<15} {'ETH (30 gwei)':<20} {'USD ($3000/ETH)'}")
+        print("-" * 80)
+        
+        costs = self.calculate_costs()
+        total_eth = 0
+        total_usd = 0
+        
+        for contract, data in costs["deployment"].items():
+            if contract != "total":
+                print(f"{contract:<25} {data['gas']:>12,} {data['eth']:>15.6f} {data['usd']:>18.2f}")
+                total_eth += data['eth']
+                total_usd += data['usd']
+        
+        print("-" * 80)
+        print(f"{'TOTAL':<25} {self.data['deployment']['total']:>12,} {total_eth:>15.6f} {total_usd:>18.2f}")
+        print("=" * 80)
+    
+    def generate_operation_table(self):
+        """Generate Table 2: Operation Gas Costs"""
+        print("\n" + "=" * 70)
+        print("TABLE 2: OPERATION GAS COSTS")
+        print("=" * 70)
+        print(f"{'Operation':<35} {'Gas Used':<15} {'Category'}")
+        print("-" * 70)
+        
+        # Group operations by category
+        read_ops = ["getPublicKey_cold", "getPublicKey_warm", "getThresholdConfig", 
+                    "isUsed_fresh", "isAuthorized"]
+        write_ops = ["markUsed_first", "markUsed_subsequent", "addAuthorizedKey"]
+        signature_ops = ["isValidSignature", "ecrecover_baseline"]
+        ops = self.data["operations"]
+        
+        print("READ OPERATIONS:")
+        for op in read_ops:
+            gas = ops.get(op)
+            if gas is not None:
+                print(f"  {op:<33} {gas:>12,} Read")
+        
+        print("\nWRITE OPERATIONS:")
+        for op in write_ops:
+            gas = ops.get(op)
+            if gas is not None:
+                print(f"  {op:<33} {gas:>12,} Write")
+        
+        print("\nSIGNATURE VALIDATION:")
+        for op in signature_ops:
+            gas = ops.get(op)
+            if gas is not None:
+                print(f"  {op:<33} {gas:>12,} Crypto")
+        
+        print("\nFULL AUTHENTICATION:")
+        gas = ops.get("fullAuthentication")
+        if gas is not None:
+            print(f"  {'Complete auth flow':<33} {gas:>12,} Full")
+        
+        print("=" * 70)
+    
+    def generate_comparison_table(self):
+        """Generate Table 3: Batch vs Individual Operations"""
+        print("\n" + "=" * 70)
+        print("TABLE 3: BATCH OPERATION EFFICIENCY")
+        print("=" * 70)
+        
+        ops = self.data["operations"]
+        
+        individual_total = ops.get("individual_checks", 0)
+        individual_avg = ops.get("individual_checks_avg", 0)
+        batch_total = ops.get("batch_checks", 0)
+        batch_avg = ops.get("batch_checks_avg", 0)
+        
+        savings_pct = ((individual_total - batch_total) / individual_total * 100) if individual_total > 0 else 0
+        
+        print(f"{'Method':<20} {'Total Gas':<15} {'Avg per Token':<15} {'Savings'}")
+        print("-" * 70)
+        print(f"{'Individual Calls':<20} {individual_total:>12,} {individual_avg:>12,} -")
+        print(f"{'Batch Call':<20} {batch_total:>12,} {batch_avg:>12,} {savings_pct:>5.1f}%")
+        print("-" * 70)
+        print(f"Gas saved by batching: {individual_total - batch_total:,} ({savings_pct:.1f}% reduction)")
+        print("=" * 70)
+    
+    def visualize_deployment_costs(self):
+        """Generate Figure 1: Deployment Cost Breakdown"""
+        contracts = []
+        gas_costs = []
+        
+        for contract, gas in self.data["deployment"].items():
+            if contract != "total":
+                contracts.append(contract.replace("_", " ").title())
+                gas_costs.append(gas)
+        
+        fig = _new_figure(figsize=(14, 5))
+        ax1, ax2 = fig.subplots(1, 2)
+        
+        # Bar chart
+        from matplotlib import colormaps
+        colors = colormaps["viridis"](np.linspace(0.3, 0.9, len(contracts)))
+        bars = ax1.bar(contracts, gas_costs, color=colors, edgecolor='black', linewidth=1.5)
+        ax1.set_ylabel('Gas Cost', fontsize=12, fontweight='bold')
+        ax1.set_title('Deployment Gas Costs by Contract', fontsize=14, fontweight='bold')
+        ax1.tick_params(axis='x', rotation=45)
+        ax1.grid(axis='y', alpha=0.3)
+        
+        # Add value labels on bars
+        for bar in bars:
+            height = bar.get_height()
+            ax1.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{int(height):,}',
+                    ha='center', va='bottom', fontsize=10)
+        
+        # Pie chart
+        ax2.pie(gas_costs, labels=contracts, autopct='%1.1f%%',
+                colors=colors, startangle=90, textprops={'fontsize': 10})
+        ax2.set_title('Deployment Cost Distribution', fontsize=14, fontweight='bold')
+        
+        fig.tight_layout()
+        fig.savefig('/mnt/user-data/outputs/deployment_costs.png', dpi=300, bbox_inches='tight')
+        print("✅ Figure saved: deployment_costs.png")
+    
+    def visualize_operation_costs(self):
+        """Generate Figure 2: Operation Gas Costs Comparison"""
+        # Group operations
+        operations = {
+            'Read': ['getPublicKey_warm', 'isUsed_fresh', 'isAuthorized'],
+            'Write': ['markUsed_first', 'addAuthorizedKey'],
+            'Signature': ['isValidSignature', 'fullAuthentication']
+        }
+        
+        fig = _new_figure(figsize=(12, 6))
+        ax = fig.subplots()
+        
+        x_pos = 0
+        colors = {'Read': '#3498db', 'Write': '#e74c3c', 'Signature': '#f39c12'}
+        
+        for category, ops in operations.items():
+            for op in ops:
+                if op in self.data["operations"]:
+                    gas = self.data["operations"][op]
+                    label = op.replace("_", " ").title()
+                    
+                    bar = ax.bar(x_pos, gas, color=colors[category], 
+                                edgecolor='black', linewidth=1.5,
+                                label=category if op == ops[0] else "")
+                    
+                    # Add value label
+                    ax.text(x_pos, gas, f'{gas:,}', 
+                           ha='center', va='bottom', fontsize=9, rotation=0)
+                    
+                    # Add operation name
+                    ax.text(x_pos, -5000, label, 
+                           ha='right', va='top', fontsize=9, rotation=45)
+                    
+                    x_pos += 1
+        
+        ax.set_ylabel('Gas Cost', fontsize=12, fontweight='bold')
+        ax.set_title('Gas Costs by Operation Type', fontsize=14, fontweight='bold')
+        ax.set_xticks([])
+        ax.legend(fontsize=11)
+        ax.grid(axis='y', alpha=0.3)
+        
+        fig.tight_layout()
+        fig.savefig('/mnt/user-data/outputs/operation_costs.png', dpi=300, bbox_inches='tight')
+        print("✅ Figure saved: operation_costs.png")
+    
+    def visualize_batch_comparison(self):
+        """Generate Figure 3: Batch vs Individual Comparison"""
+        ops = self.data["operations"]
+        
+        methods = ['Individual\nCalls', 'Batch\nCall']
+        total_gas = [
+            ops.get("individual_checks", 0),
+            ops.get("batch_checks", 0)
+        ]
+        avg_gas = [
+            ops.get("individual_checks_avg", 0),
+            ops.get("batch_checks_avg", 0)
+        ]
+        
+        fig = _new_figure(figsize=(12, 5))
+        ax1, ax2 = fig.subplots(1, 2)
+        
+        # Total gas comparison
+        bars1 = ax1.bar(methods, total_gas, color=['#e74c3c', '#27ae60'], 
+                       edgecolor='black', linewidth=2)
+        ax1.set_ylabel('Total Gas (10 tokens)', fontsize=12, fontweight='bold')
+        ax1.set_title('Total Gas Consumption', fontsize=14, fontweight='bold')
+        ax1.grid(axis='y', alpha=0.3)
+        
+        for bar, val in zip(bars1, total_gas):
+            ax1.text(bar.get_x() + bar.get_width()/2., val,
+                    f'{int(val):,}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+        
+        # Average gas comparison
+        bars2 = ax2.bar(methods, avg_gas, color=['#e74c3c', '#27ae60'],
+                       edgecolor='black', linewidth=2)
+        ax2.set_ylabel('Average Gas per Token', fontsize=12, fontweight='bold')
+        ax2.set_title('Gas Efficiency per Token', fontsize=14, fontweight='bold')
+        ax2.grid(axis='y', alpha=0.3)
+        
+        for bar, val in zip(bars2, avg_gas):
+            ax2.text(bar.get_x() + bar.get_width()/2., val,
+                    f'{int(val):,}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+        
+        fig.tight_layout()
+        fig.savefig('/mnt/user-data/outputs/batch_comparison.png', dpi=300, bbox_inches='tight')
+        print("✅ Figure saved: batch_comparison.png")
+    
+    def generate_latex_tables(self):
+        """Generate LaTeX tables for research paper"""
+        # Table 1: Deployment Costs
+        latex = list(_LATEX_DEPLOYMENT_HEADER)
+        
+        costs = self.calculate_costs()
+        for contract, data in costs["deployment"].items():
+            if contract != "total":
+                name = contract.replace("_", " ").title()
+                latex.append(f"{name} & {data['gas']:,} & {data['eth']:.6f} & \\${data['usd']:.2f} \\\\")
+        
+        total = costs["deployment"]["total"]
+        latex.append("\\midrule")
+        latex.append(f"Total & {total['gas']:,} & {total['eth']:.6f} & \\${total['usd']:.2f} \\\\")
+        latex.extend(_LATEX_FOOTER)
+        latex.append("")
+        
+        # Table 2: Operation Costs
+        latex.extend(_LATEX_OPERATION_HEADER)
+        
+        ops = self.data["operations"]
+        
+        # Read operations
+        read_ops = [
+            ("getPublicKey_warm", "Get Public Key"),
+            ("isUsed_fresh", "Check Token Freshness"),
+            ("isAuthorized", "Check Authorization")
+        ]
+        
+        latex.extend(
+            f"{op_name} & {gas:,} & Read \\\\"
+            for op_key, op_name in read_ops if (gas := ops.get(op_key)) is not None
+        )
+        
+        latex.append("\\midrule")
+        
+        # Write operations
+        write_ops = [
+            ("markUsed_first", "Burn Token (First)"),
+            ("addAuthorizedKey", "Add Authorized Key"),
+            ("fullAuthentication", "Full Authentication")
+        ]
+        
+        latex.extend(
+            f"{op_name} & {gas:,} & Write \\\\"
+            for op_key, op_name in write_ops if (gas := ops.get(op_key)) is not None
+        )
+        
+        latex.extend(_LATEX_FOOTER)
+        
+        latex_str = "\n".join(latex)
+        
+        with open('/mnt/user-data/outputs/gas_tables.tex', 'w') as f:
+            f.write(latex_str)
+        
+        print("✅ LaTeX tables saved: gas_tables.tex")
+        return latex_str
+    
+    def generate_full_report(self):
+        """Generate complete gas analysis report"""
+        print("\n" + "=" * 80)
+        print("GAS CONSUMPTION ANALYSIS FOR RESEARCH PAPER")
+        print("=" * 80)
+        
+        # Tables
+        self.generate_deployment_table()
+        self.generate_operation_table()
+        self.generate_comparison_table()
+        
+        # Figures
+        print("\n📊 Generating Visualizations...")
+        # Checked up front so errors raised while plotting still propagate
+        figures_saved = importlib.util.find_spec("matplotlib") is not None
+        if figures_saved:
+            self.visualize_deployment_costs()
+            self.visualize_operation_costs()
+            self.visualize_batch_comparison()
+        else:
+            print("⚠️  matplotlib not installed, skipping figures")
+            print("Run: pip install matplotlib")
+        
+        # LaTeX tables
+        print("\n📝 Generating LaTeX Tables...")
+        self.generate_latex_tables()
+        
+        print("\n" + "=" * 80)
+        print("✅ GAS ANALYSIS COMPLETE")
+        print("=" * 80)
+        print("\nGenerated files:")
+        if figures_saved:
+            print("  - deployment_costs.png       (Figure for paper)")
+            print("  - operation_costs.png        (Figure for paper)")
+            print("  - batch_comparison.png       (Figure for paper)")
+        print("  - gas_tables.tex             (LaTeX tables)")
+        
+        return self.data
+
+
+if __name__ == "__main__":
+    # Run analysis
+    analyzer = GasAnalyzer()
+    analyzer.generate_full_report()
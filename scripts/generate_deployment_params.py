@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Generate constructor parameters for Remix deployment
+This script helps create properly formatted arguments for deploying contracts
+"""
+
+import secrets
+
+try:
+    from eth_utils import keccak
+    from py_ecc.secp256k1 import secp256k1
+except ImportError:
+    if __name__ != "__main__":
+        raise
+    print("❌ Missing dependencies!")
+    print("Run: pip install eth-utils py_ecc")
+    exit(1)
+
+try:
+    # libsecp256k1 bindings; py_ecc is used as a fallback
+    from coincurve import PrivateKey
+except ImportError:
+    PrivateKey = None
+
+try:
+    # Call pycryptodome's Keccak-256 directly instead of going through
+    # eth_utils' backend dispatch
+    from Crypto.Hash import keccak as _keccak_impl
+    
+    def _keccak256(data):
+        return _keccak_impl.new(digest_bits=256, data=data).digest()
+except ImportError:
+    _keccak256 = keccak
+
+# Generator in Jacobian coordinates for the py_ecc fallback
+_G_JACOBIAN = secp256k1.to_jacobian(secp256k1.G)
+
+def _batch_inverse(values, modulus):
+    """Invert every element of values mod modulus with one inversion (Montgomery's trick)"""
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = (acc * v) % modulus
+        prefix.append(acc)
+    
+    inv = pow(acc, -1, modulus)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = (inv * prefix[i - 1]) % modulus
+        inv = (inv * values[i]) % modulus
+    inverses[0] = inv
+    
+    return inverses
+
+def _to_affine_many(points):
+    """Convert Jacobian points to affine (x, y) sharing a single field inversion"""
+    P = secp256k1.P
+    z_invs = _batch_inverse([Z for _, _, Z in points], P)
+    return [
+        ((X * zi * zi) % P, (Y * zi * zi * zi) % P)
+        for (X, Y, _), zi in zip(points, z_invs)
+    ]
+
+def _rand_scalar():
+    """Uniform private key in [1, N - 1] by rejection sampling 256 random bits"""
+    while True:
+        k = secrets.randbits(256)
+        if 0 < k < secp256k1.N:
+            return k
+
+def generate_keypairs(count):
+    """Generate count sample keypairs"""
+    # Generate private keys
+    sks = [_rand_scalar() for _ in range(count)]
+    
+    # Compute public keys K = g^sk
+    if PrivateKey is not None:
+        pks = [PrivateKey.from_int(sk).public_key.point() for sk in sks]
+    else:
+        # Stay in Jacobian coordinates; normalize all keys with one inversion
+        pks = _to_affine_many([secp256k1.jacobian_multiply(_G_JACOBIAN, sk) for sk in sks])
+    
+    return list(zip(sks, pks))
+
+def generate_ca_keypair():
+    """Generate a sample CA threshold keypair"""
+    return generate_keypairs(1)[0]
+
+def point_to_bytes32_pair(point):
+    """Convert EC point to two bytes32 values for Solidity"""
+    x, y = point
+    # One 64-byte encoding, split into the two big-endian words (faster
+    # than packing 64-bit limbs with struct, which needs eight shift/masks)
+    public_key = ((x << 256) | y).to_bytes(64, 'big')
+    return public_key[:32], public_key[32:]
+
+def _checksum_address(address):
+    """EIP-55 mixed-case hex encoding of a 20-byte address"""
+    hex_address = address.hex()
+    digest = _keccak256(hex_address.encode()).hex()
+    # Upper-case each letter whose digest nibble is >= 8
+    return "0x" + "".join(c.upper() if d >= "8" else c for c, d in zip(hex_address, digest))
+
+def point_to_address(point):
+    """Convert EC point to Ethereum address"""
+    x, y = point
+    public_key = ((x << 256) | y).to_bytes(64, 'big')
+    hash_output = _keccak256(public_key)
+    address = _checksum_address(hash_output[-20:])
+    return address
+
+def main():
+    print("=" * 70)
+    print("REMIX DEPLOYMENT PARAMETER GENERATOR")
+    print("=" * 70)
+    print()
+    
+    # Generate the CA keypair and the sample owner keypair in one batch
+    print("🔑 Generating CA Threshold Keypair...")
+    (ca_sk, ca_pk), (owner_sk, owner_pk) = generate_keypairs(2)
+    
+    # Convert to Solidity format
+    pk_x, pk_y = point_to_bytes32_pair(ca_pk)
+    pk_x_hex = "0x" + pk_x.hex()
+    pk_y_hex = "0x" + pk_y.hex()
+    
+    print(f"✅ CA Private Key (for testing): {hex(ca_sk)}")
+    print(f"✅ CA Public Key X: {pk_x_hex}")
+    print(f"✅ CA Public Key Y: {pk_y_hex}")
+    print()
+    
+    # Generate sample owner address from biometric K
+    print("👤 Generating Sample Biometric-Derived Owner Address...")
+    owner_address = point_to_address(owner_pk)
+    
+    print(f"✅ Owner Private Key (simulated biometric): {hex(owner_sk)}")
+    print(f"✅ Owner Address: {owner_address}")
+    print()
+    
+    # Print deployment parameters
+    print("=" * 70)
+    print("📋 STEP 1: DEPLOY ParamRegistry")
+    print("=" * 70)
+    print("\nCopy these parameters into Remix:")
+    print("-" * 70)
+    print(f"_pkCA_x:    {pk_x_hex}")
+    print(f"_pkCA_y:    {pk_y_hex}")
+    print("_t:         1")
+    print("_n:         3")
+    print('_hashSpec:  "Keccak256-H0-H1"')
+    print("-" * 70)
+    print()
+    
+    print("=" * 70)
+    print("📋 STEP 2: DEPLOY SpentSet")
+    print("=" * 70)
+    print("\n✅ No constructor arguments needed!")
+    print("Just click 'Deploy'")
+    print()
+    
+    print("=" * 70)
+    print("📋 STEP 3: DEPLOY BiometricWallet")
+    print("=" * 70)
+    print("\nAfter deploying SpentSet, use these parameters:")
+    print("-" * 70)
+    print(f"ownerAddr:  {owner_address}")
+    print(f"_spentSet:  [PASTE_SPENTSET_ADDRESS_HERE]")
+    print("-" * 70)
+    print()
+    
+    print("=" * 70)
+    print("📋 STEP 4: AUTHORIZE WALLET IN SPENTSET")
+    print("=" * 70)
+    print("\nAfter deploying BiometricWallet:")
+    print("1. Go to deployed SpentSet contract")
+    print("2. Call: authorizeWallet([PASTE_BIOMETRIC_WALLET_ADDRESS])")
+    print()
+    
+    # Save to file
+    with open('/mnt/user-data/outputs/deployment_params.txt', 'w') as f:
+        f.write(
+            f"DEPLOYMENT PARAMETERS\n"
+            f"{'=' * 70}\n\n"
+            f"ParamRegistry Constructor:\n"
+            f"  _pkCA_x: {pk_x_hex}\n"
+            f"  _pkCA_y: {pk_y_hex}\n"
+            f"  _t: 1\n"
+            f"  _n: 3\n"
+            f"  _hashSpec: \"Keccak256-H0-H1\"\n\n"
+            f"BiometricWallet Constructor:\n"
+            f"  ownerAddr: {owner_address}\n"
+            f"  _spentSet: [PASTE_SPENTSET_ADDRESS]\n\n"
+            f"Testing Keys (Keep Secret!):\n"
+            f"  CA Private Key: {hex(ca_sk)}\n"
+            f"  Owner Private Key: {hex(owner_sk)}\n"
+        )
+    
+    print("✅ Parameters saved to: deployment_params.txt")
+    print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Make the scripts importable as top-level modules from the tests"""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [SCRIPTS_DIR, os.path.join(SCRIPTS_DIR, "Perfomance Testing")]
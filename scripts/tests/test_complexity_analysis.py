@@ -0,0 +1,63 @@
+"""Correctness checks for the primitives timed by complexity_analysis.py"""
+
+import secrets
+from functools import reduce
+
+import pytest
+from py_ecc.secp256k1 import secp256k1
+
+import complexity_analysis as ca
+
+BACKENDS = [
+    "py_ecc",
+    pytest.param("coincurve", marks=pytest.mark.skipif(
+        ca.PublicKey is None, reason="coincurve not installed")),
+]
+
+
+def _affine(point):
+    """py_ecc affine (x, y) for a point from either backend"""
+    return point if isinstance(point, tuple) else point.point()
+
+
+def _rand_scalar():
+    return secrets.randbelow(secp256k1.N - 1) + 1
+
+
+@pytest.mark.parametrize("t", [0, 1, 2, 5])
+def test_share_interpolate_round_trip(t):
+    analyzer = ca.ComplexityAnalyzer()
+    coefficients = [_rand_scalar() for _ in range(t + 1)]
+    xs, ys = analyzer._share(coefficients, t + 3)
+
+    assert xs == list(range(1, t + 4))
+    assert ys == [
+        sum(c * x ** j for j, c in enumerate(coefficients)) % analyzer.N for x in xs
+    ]
+    # Any t+1 shares recover f(0)
+    assert analyzer._interpolate_at_zero(xs[:t + 1], ys[:t + 1]) == coefficients[0]
+    assert analyzer._interpolate_at_zero(xs[2:], ys[2:]) == coefficients[0]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_mul2_many_matches_separate_multiplications(backend):
+    analyzer = ca.ComplexityAnalyzer(backend)
+    R0 = analyzer._mul_g(_rand_scalar())
+    ws = [_rand_scalar() for _ in range(4)] + [1, 2, analyzer.N - 1]
+    fs = [_rand_scalar() for _ in range(4)] + [analyzer.N - 1, 1, 3]
+
+    expected = [
+        secp256k1.add(_affine(analyzer._mul_g(f)), _affine(analyzer._mul(R0, w)))
+        for w, f in zip(ws, fs)
+    ]
+    assert [_affine(p) for p in analyzer._mul2_many(R0, ws, fs)] == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_multi_exp_matches_separate_multiplications(backend):
+    analyzer = ca.ComplexityAnalyzer(backend)
+    points = [analyzer._mul_g(_rand_scalar()) for _ in range(3)]
+    scalars = [_rand_scalar() for _ in range(3)]
+
+    expected = reduce(secp256k1.add, (_affine(analyzer._mul(p, k)) for p, k in zip(points, scalars)))
+    assert _affine(analyzer._multi_exp(points, scalars)) == expected
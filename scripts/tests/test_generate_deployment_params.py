@@ -0,0 +1,62 @@
+"""Encoding checks for generate_deployment_params.py"""
+
+import pytest
+from eth_utils import keccak, to_checksum_address
+from py_ecc.secp256k1 import secp256k1
+
+import generate_deployment_params as params
+
+# Test vectors from the EIP-55 specification
+EIP55_VECTORS = [
+    # All caps
+    "0x52908400098527886E0F7030069857D2E4169EE7",
+    "0x8617E340B3D01FA5F11F306F4090FD50E238070D",
+    # All lower
+    "0xde709f2102306220921060314715629080e2fb77",
+    "0x27b1fdb04752bbc536007a920d24acb045561c26",
+    # Normal
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
+POINTS = [
+    secp256k1.G,
+    secp256k1.multiply(secp256k1.G, 2),
+    secp256k1.multiply(secp256k1.G, secp256k1.N - 1),
+    # Not on the curve; exercises leading zero bytes and all-ones words
+    (1, 2),
+    (0, 2 ** 256 - 1),
+]
+
+
+@pytest.mark.parametrize("address", EIP55_VECTORS)
+def test_checksum_address_eip55_vectors(address):
+    assert params._checksum_address(bytes.fromhex(address[2:])) == address
+
+
+@pytest.mark.parametrize("point", POINTS)
+def test_point_to_bytes32_pair_matches_per_word_encoding(point):
+    x, y = point
+    assert params.point_to_bytes32_pair(point) == (x.to_bytes(32, 'big'), y.to_bytes(32, 'big'))
+
+
+@pytest.mark.parametrize("point", POINTS[:3])
+def test_point_to_address_matches_eth_utils(point):
+    x, y = point
+    digest = keccak(x.to_bytes(32, 'big') + y.to_bytes(32, 'big'))
+    assert params.point_to_address(point) == to_checksum_address(digest[-20:])
+
+
+@pytest.mark.parametrize("use_coincurve", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        params.PrivateKey is None, reason="coincurve not installed")),
+])
+def test_generate_keypairs_public_keys(monkeypatch, use_coincurve):
+    if not use_coincurve:
+        monkeypatch.setattr(params, "PrivateKey", None)
+    for sk, pk in params.generate_keypairs(3):
+        assert 0 < sk < secp256k1.N
+        assert pk == secp256k1.multiply(secp256k1.G, sk)